@@ -14,6 +14,10 @@
 
 """Tools for running core reports using the Data API."""
 
+import asyncio
+import functools
+import time
+
 from typing import Any, Dict, List
 
 from analytics_mcp.coordinator import mcp
@@ -25,10 +29,13 @@ from analytics_mcp.tools.reporting.metadata import (
 )
 from analytics_mcp.tools.utils import (
     construct_property_rn,
-    create_data_api_client,
+    get_data_api_client,
+    proto_to_columnar,
     proto_to_dict,
 )
 from google.analytics import data_v1beta
+from google.api_core import retry_async
+import orjson
 
 
 def _run_report_description() -> str:
@@ -79,6 +86,200 @@ def _run_report_description() -> str:
           """
 
 
+# Caches for the small protos that recur across report requests, such as the
+# dimensions and metrics of a frequently refreshed report. The cached protos
+# are never mutated after construction, and protobuf copies messages on
+# assignment to a request field, so sharing them is safe.
+@functools.lru_cache(maxsize=512)
+def _dimension(name: str) -> data_v1beta.Dimension:
+    """Returns a cached `Dimension` proto for the given name."""
+    return data_v1beta.Dimension(name=name)
+
+
+@functools.lru_cache(maxsize=512)
+def _metric(name: str) -> data_v1beta.Metric:
+    """Returns a cached `Metric` proto for the given name."""
+    return data_v1beta.Metric(name=name)
+
+
+@functools.lru_cache(maxsize=512)
+def _date_range(items: tuple) -> data_v1beta.DateRange:
+    """Returns a cached `DateRange` proto.
+
+    Takes the date range dict's items as a hashable tuple since dicts can't
+    be cache keys.
+    """
+    return data_v1beta.DateRange(dict(items))
+
+
+# Memoized dict-to-proto conversion for filter expressions and order bys.
+# Protobuf's generic dict conversion walks message descriptors at runtime,
+# so repeated requests with the same filters (dashboard refreshes) can skip
+# that work. As with the caches above, the protos are never mutated and
+# protobuf copies on assignment, so sharing is safe.
+_MAX_PROTO_CACHE_ENTRIES = 512
+
+_filter_expressions: Dict[tuple, data_v1beta.FilterExpression] = {}
+_order_bys: Dict[tuple, data_v1beta.OrderBy] = {}
+
+
+def _freeze(value):
+    """Recursively converts a JSON-style value into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(
+            (key, _freeze(item)) for key, item in sorted(value.items())
+        )
+    if isinstance(value, list):
+        return ("__list__", *(_freeze(item) for item in value))
+    return value
+
+
+def _cached_proto(cache, message_type, mapping):
+    """Returns a proto for `mapping`, reusing a cached instance if present."""
+    try:
+        # The lookup is what hashes the key, so an unhashable leaf in the
+        # mapping raises here rather than in _freeze.
+        key = _freeze(mapping)
+        proto_value = cache.get(key)
+    except TypeError:
+        # Not hashable; fall back to direct construction.
+        return message_type(mapping)
+    if proto_value is None:
+        if len(cache) >= _MAX_PROTO_CACHE_ENTRIES:
+            cache.clear()
+        proto_value = cache[key] = message_type(mapping)
+    return proto_value
+
+
+def _filter_expression(
+    expression: Dict[str, Any],
+) -> data_v1beta.FilterExpression:
+    """Returns a cached `FilterExpression` built from a dict."""
+    return _cached_proto(
+        _filter_expressions, data_v1beta.FilterExpression, expression
+    )
+
+
+def _order_by(order_by: Dict[str, Any]) -> data_v1beta.OrderBy:
+    """Returns a cached `OrderBy` built from a dict."""
+    return _cached_proto(_order_bys, data_v1beta.OrderBy, order_by)
+
+
+# Bounded retry for transient Data API errors (quota exhaustion, brief
+# unavailability). Exponential backoff with jitter, capped at 30 seconds
+# overall, so one flaky call can't stall its caller for the full RPC timeout.
+_RUN_REPORT_RETRY = retry_async.AsyncRetry(
+    predicate=retry_async.if_transient_error,
+    initial=0.1,
+    maximum=5.0,
+    multiplier=2.0,
+    timeout=30.0,
+)
+
+
+class _CircuitBreaker:
+    """Minimal circuit breaker for the report RPC.
+
+    After `fail_max` consecutive failures the breaker opens and report calls
+    fail immediately for `reset_timeout` seconds, instead of each caller
+    waiting out retries against an unhealthy backend. After the timeout a
+    single probe call is let through; success closes the breaker again.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self._fail_max = fail_max
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+
+    def check(self) -> None:
+        """Raises RuntimeError if the breaker is open."""
+        if self._opened_at is None:
+            return
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            # Half-open: let the next call probe the backend. A failure
+            # reopens the breaker immediately.
+            self._opened_at = None
+            self._failures = self._fail_max - 1
+            return
+        raise RuntimeError(
+            "Data API report calls are temporarily suspended after "
+            f"{self._fail_max} consecutive failures. Retry in up to "
+            f"{self._reset_timeout:.0f} seconds."
+        )
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._fail_max:
+            self._opened_at = time.monotonic()
+
+
+_run_report_breaker = _CircuitBreaker()
+
+
+async def _run_report_rpc(
+    request: data_v1beta.RunReportRequest,
+) -> data_v1beta.RunReportResponse:
+    """Issues the run_report RPC with retry and circuit breaking."""
+    _run_report_breaker.check()
+    try:
+        response = await get_data_api_client().run_report(
+            request, retry=_RUN_REPORT_RETRY
+        )
+    except Exception:
+        _run_report_breaker.record_failure()
+        raise
+    _run_report_breaker.record_success()
+    return response
+
+
+def _build_report_request(
+    property_id: int | str,
+    date_ranges: List[Dict[str, str]],
+    dimensions: List[str],
+    metrics: List[str],
+    dimension_filter: Dict[str, Any] = None,
+    metric_filter: Dict[str, Any] = None,
+    order_bys: List[Dict[str, Any]] = None,
+    limit: int = None,
+    offset: int = None,
+    currency_code: str = None,
+    return_property_quota: bool = False,
+) -> data_v1beta.RunReportRequest:
+    """Builds a `RunReportRequest` from `run_report` arguments."""
+    request = data_v1beta.RunReportRequest(
+        property=construct_property_rn(property_id),
+        dimensions=[_dimension(dimension) for dimension in dimensions],
+        metrics=[_metric(metric) for metric in metrics],
+        date_ranges=[
+            _date_range(tuple(sorted(dr.items()))) for dr in date_ranges
+        ],
+        return_property_quota=return_property_quota,
+    )
+
+    if dimension_filter:
+        request.dimension_filter = _filter_expression(dimension_filter)
+
+    if metric_filter:
+        request.metric_filter = _filter_expression(metric_filter)
+
+    if order_bys:
+        request.order_bys = [_order_by(order_by) for order_by in order_bys]
+
+    if limit:
+        request.limit = limit
+    if offset:
+        request.offset = offset
+    if currency_code:
+        request.currency_code = currency_code
+
+    return request
+
+
 async def run_report(
     property_id: int | str,
     date_ranges: List[Dict[str, str]],
@@ -138,39 +339,171 @@ async def run_report(
           report uses the property's default currency.
         return_property_quota: Whether to return property quota in the response.
     """
-    request = data_v1beta.RunReportRequest(
-        property=construct_property_rn(property_id),
-        dimensions=[
-            data_v1beta.Dimension(name=dimension) for dimension in dimensions
-        ],
-        metrics=[data_v1beta.Metric(name=metric) for metric in metrics],
-        date_ranges=[data_v1beta.DateRange(dr) for dr in date_ranges],
+    request = _build_report_request(
+        property_id,
+        date_ranges,
+        dimensions,
+        metrics,
+        dimension_filter=dimension_filter,
+        metric_filter=metric_filter,
+        order_bys=order_bys,
+        limit=limit,
+        offset=offset,
+        currency_code=currency_code,
         return_property_quota=return_property_quota,
     )
 
-    if dimension_filter:
-        request.dimension_filter = data_v1beta.FilterExpression(
-            dimension_filter
+    response = await _run_report_rpc(request)
+
+    return proto_to_dict(response)
+
+
+async def run_report_json(*args, **kwargs) -> bytes:
+    """Runs a report and returns the response as JSON bytes.
+
+    For HTTP embedders (see app.py) that send the report straight back to
+    the client: the response is serialized to bytes exactly once, with no
+    intermediate dict handed to the web framework to re-encode. Accepts the
+    same arguments as `run_report`. Not registered as an MCP tool.
+    """
+    request = _build_report_request(*args, **kwargs)
+    response = await _run_report_rpc(request)
+    return orjson.dumps(proto_to_dict(response))
+
+
+@mcp.tool(
+    title="Run a Google Analytics Data API report with column-oriented results"
+)
+async def run_report_columnar(
+    property_id: int | str,
+    date_ranges: List[Dict[str, str]],
+    dimensions: List[str],
+    metrics: List[str],
+    dimension_filter: Dict[str, Any] = None,
+    metric_filter: Dict[str, Any] = None,
+    order_bys: List[Dict[str, Any]] = None,
+    limit: int = None,
+    offset: int = None,
+    currency_code: str = None,
+) -> Dict[str, Any]:
+    """Runs a Data API report and returns column-oriented results.
+
+    A compact alternative to `run_report` for large result sets. Instead of
+    one dictionary per row, the response contains one list of values per
+    dimension and metric, keyed by name, plus the total "row_count". Metric
+    values are returned as numbers. Prefer this over `run_report` when
+    retrieving many rows for aggregation or charting.
+
+    Accepts the same arguments as `run_report`; see that tool for the
+    expected format of each argument.
+    """
+    request = _build_report_request(
+        property_id,
+        date_ranges,
+        dimensions,
+        metrics,
+        dimension_filter=dimension_filter,
+        metric_filter=metric_filter,
+        order_bys=order_bys,
+        limit=limit,
+        offset=offset,
+        currency_code=currency_code,
+    )
+
+    response = await _run_report_rpc(request)
+
+    return proto_to_columnar(response)
+
+
+async def run_report_paginated(
+    property_id: int | str,
+    date_ranges: List[Dict[str, str]],
+    dimensions: List[str],
+    metrics: List[str],
+    dimension_filter: Dict[str, Any] = None,
+    metric_filter: Dict[str, Any] = None,
+    order_bys: List[Dict[str, Any]] = None,
+    currency_code: str = None,
+    page_size: int = 10_000,
+):
+    """Runs a report and yields it one page of rows at a time.
+
+    An async generator alternative to `run_report` for programmatic callers
+    that consume large reports. Instead of materializing the full response in
+    memory, issues one request per page of `page_size` rows and yields each
+    page's dictionary as it arrives, so peak memory is bounded by the page
+    size. Not registered as an MCP tool since tools return a single value.
+
+    Accepts the same arguments as `run_report`, except that `limit`/`offset`
+    are managed internally via `page_size`.
+    """
+    offset = 0
+    while True:
+        request = _build_report_request(
+            property_id,
+            date_ranges,
+            dimensions,
+            metrics,
+            dimension_filter=dimension_filter,
+            metric_filter=metric_filter,
+            order_bys=order_bys,
+            limit=page_size,
+            offset=offset,
+            currency_code=currency_code,
         )
+        response = await _run_report_rpc(request)
+        yield proto_to_dict(response)
+        offset += len(response.rows)
+        if not response.rows or offset >= response.row_count:
+            break
 
-    if metric_filter:
-        request.metric_filter = data_v1beta.FilterExpression(metric_filter)
 
-    if order_bys:
-        request.order_bys = [
-            data_v1beta.OrderBy(order_by) for order_by in order_bys
-        ]
+@mcp.tool(title="Run multiple Google Analytics Data API reports concurrently")
+async def run_reports(
+    property_id: int | str,
+    report_specs: List[Dict[str, Any]],
+) -> Dict[str, List[Any]]:
+    """Runs multiple Google Analytics Data API reports for a property.
 
-    if limit:
-        request.limit = limit
-    if offset:
-        request.offset = offset
-    if currency_code:
-        request.currency_code = currency_code
+    The reports are issued concurrently, so N reports take roughly the time
+    of the slowest one rather than the sum of all of them. Use this instead
+    of repeated `run_report` calls when several independent reports are
+    needed, such as one report per date range.
 
-    response = await create_data_api_client().run_report(request)
+    Args:
+        property_id: The Google Analytics property ID. Accepted formats are:
+          - A number
+          - A string consisting of 'properties/' followed by a number
+        report_specs: A list of report specifications. Each specification is a
+          dictionary of `run_report` arguments, excluding `property_id`. For
+          example: {"date_ranges": [...], "dimensions": [...],
+          "metrics": [...]}. See the `run_report` tool for the expected
+          format of each argument.
 
-    return proto_to_dict(response)
+    Returns:
+        A dictionary with a "reports" list and an "errors" list, both with one
+        entry per report specification, in order. A report that succeeds has
+        its response in "reports" and None in "errors"; a report that fails
+        has None in "reports" and an error message in "errors".
+    """
+    requests = [
+        _build_report_request(property_id, **spec) for spec in report_specs
+    ]
+    responses = await asyncio.gather(
+        *(_run_report_rpc(request) for request in requests),
+        return_exceptions=True,
+    )
+
+    reports = []
+    errors = []
+    for response in responses:
+        if isinstance(response, Exception):
+            reports.append(None)
+            errors.append(str(response))
+        else:
+            reports.append(proto_to_dict(response))
+            errors.append(None)
+    return {"reports": reports, "errors": errors}
 
 
 # The `run_report` tool requires a more complex description that's generated at
@@ -14,19 +14,21 @@
 
 """Metadata to provide context and hints for reporting tools."""
 
+import time
+
 from typing import Any, Dict, List
 
 from analytics_mcp.coordinator import mcp
 from analytics_mcp.tools.utils import (
     construct_property_rn,
-    create_data_api_client,
+    get_data_api_client,
     proto_to_dict,
     proto_to_json,
 )
 from google.analytics import data_v1beta
 
 
-def get_date_ranges_hints():
+def _build_date_ranges_hints():
     range_jan = data_v1beta.DateRange(
         start_date="2025-01-01", end_date="2025-01-31", name="Jan2025"
     )
@@ -116,7 +118,7 @@ _FILTER_NOTES = """
   """
 
 
-def get_metric_filter_hints():
+def _build_metric_filter_hints():
     """Returns hints and samples for metric_filter arguments."""
     event_count_gt_10_filter = data_v1beta.FilterExpression(
         filter=data_v1beta.Filter(
@@ -155,8 +157,7 @@ def get_metric_filter_hints():
             expressions=[event_count_gt_10_filter, revenue_between_filter]
         )
     )
-    return (
-        f"""Example metric_filter arguments:
+    return f"""Example metric_filter arguments:
       1. A simple filter:
         {proto_to_json(event_count_gt_10_filter)}
 
@@ -172,12 +173,10 @@ def get_metric_filter_hints():
       5. An OR group filter:
         {proto_to_json(or_filter)}
 
-    """
-        + _FILTER_NOTES
-    )
+    """ + _FILTER_NOTES
 
 
-def get_dimension_filter_hints():
+def _build_dimension_filter_hints():
     """Returns hints and samples for dimension_filter arguments."""
     begins_with = data_v1beta.FilterExpression(
         filter=data_v1beta.Filter(
@@ -222,8 +221,7 @@ def get_dimension_filter_hints():
             expressions=[source_medium_filter, event_list_filter]
         )
     )
-    return (
-        f"""Example dimension_filter arguments:
+    return f"""Example dimension_filter arguments:
       1. A simple filter:
         {proto_to_json(begins_with)}
 
@@ -239,12 +237,10 @@ def get_dimension_filter_hints():
       5. An OR group filter:
         {proto_to_json(or_filter)}
 
-    """
-        + _FILTER_NOTES
-    )
+    """ + _FILTER_NOTES
 
 
-def get_order_bys_hints():
+def _build_order_bys_hints():
     """Returns hints and examples for order_bys arguments."""
     dimension_alphanumeric_ascending = data_v1beta.OrderBy(
         dimension=data_v1beta.OrderBy.DimensionOrderBy(
@@ -315,6 +311,55 @@ def get_order_bys_hints():
     """
 
 
+# The hint strings never change, so they're rendered once at import time.
+# The tools and tool descriptions that embed them return these constants
+# without any per-call proto construction, serialization, or formatting.
+_DATE_RANGES_HINTS = _build_date_ranges_hints()
+_METRIC_FILTER_HINTS = _build_metric_filter_hints()
+_DIMENSION_FILTER_HINTS = _build_dimension_filter_hints()
+_ORDER_BYS_HINTS = _build_order_bys_hints()
+
+
+def get_date_ranges_hints() -> str:
+    """Returns hints and samples for date_ranges arguments."""
+    return _DATE_RANGES_HINTS
+
+
+def get_metric_filter_hints() -> str:
+    """Returns hints and samples for metric_filter arguments."""
+    return _METRIC_FILTER_HINTS
+
+
+def get_dimension_filter_hints() -> str:
+    """Returns hints and samples for dimension_filter arguments."""
+    return _DIMENSION_FILTER_HINTS
+
+
+def get_order_bys_hints() -> str:
+    """Returns hints and examples for order_bys arguments."""
+    return _ORDER_BYS_HINTS
+
+
+# A property's metadata changes rarely, so cache it per property for an hour
+# and let repeated lookups skip the RPC. Entries map a property resource name
+# to a (fetch time, Metadata) tuple.
+_METADATA_CACHE_TTL_SECONDS = 3600
+_metadata_cache: Dict[str, tuple] = {}
+
+
+async def _get_metadata_cached(property_rn: str) -> data_v1beta.Metadata:
+    """Returns the property's Metadata, cached for up to an hour."""
+    cached = _metadata_cache.get(property_rn)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _METADATA_CACHE_TTL_SECONDS:
+        return cached[1]
+    metadata = await get_data_api_client().get_metadata(
+        name=f"{property_rn}/metadata"
+    )
+    _metadata_cache[property_rn] = (now, metadata)
+    return metadata
+
+
 @mcp.tool(
     title="Retrieves the custom Core Reporting dimensions and metrics for a specific property"
 )
@@ -329,9 +374,7 @@ async def get_custom_dimensions_and_metrics(
           - A string consisting of 'properties/' followed by a number
 
     """
-    metadata = await create_data_api_client().get_metadata(
-        name=f"{construct_property_rn(property_id)}/metadata"
-    )
+    metadata = await _get_metadata_cached(construct_property_rn(property_id))
     custom_metrics = [
         proto_to_dict(metric)
         for metric in metadata.metrics
@@ -19,7 +19,7 @@ from typing import Any, Dict, List
 from analytics_mcp.coordinator import mcp
 from analytics_mcp.tools.utils import (
     construct_property_rn,
-    create_data_api_client,
+    get_data_api_client,
     proto_to_dict,
 )
 from analytics_mcp.tools.reporting.metadata import (
@@ -158,7 +158,7 @@ async def run_realtime_report(
     if offset:
         request.offset = offset
 
-    response = await create_data_api_client().run_realtime_report(request)
+    response = await get_data_api_client().run_realtime_report(request)
     return proto_to_dict(response)
 
 
@@ -14,12 +14,21 @@
 
 """Common utilities used by the MCP server."""
 
+import asyncio
+import re
+import weakref
+
 from typing import Any, Dict
 
 from google.analytics import admin_v1beta, data_v1beta
+from google.analytics.data_v1beta.services.beta_analytics_data.transports import (
+    BetaAnalyticsDataGrpcAsyncIOTransport,
+)
 from google.api_core.gapic_v1.client_info import ClientInfo
 from importlib import metadata
 import google.auth
+import grpc
+import orjson
 import proto
 
 
@@ -47,7 +56,7 @@ _READ_ONLY_ANALYTICS_SCOPE = (
 
 def _create_credentials() -> google.auth.credentials.Credentials:
     """Returns Application Default Credentials with read-only scope."""
-    (credentials, _) = google.auth.default(scopes=[_READ_ONLY_ANALYTICS_SCOPE])
+    credentials, _ = google.auth.default(scopes=[_READ_ONLY_ANALYTICS_SCOPE])
     return credentials
 
 
@@ -61,30 +70,73 @@ def create_admin_api_client() -> admin_v1beta.AnalyticsAdminServiceAsyncClient:
     )
 
 
+# Options for the Data API channel. All tool calls on an event loop share
+# one HTTP/2 connection (see get_data_api_client), so concurrent reports
+# multiplex as streams on a single socket; keepalive pings stop idle periods
+# between reports from silently dropping that connection and forcing a new
+# TCP+TLS handshake.
+_DATA_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
 def create_data_api_client() -> data_v1beta.BetaAnalyticsDataAsyncClient:
     """Returns a properly configured Google Analytics Data API async client.
 
-    Uses Application Default Credentials with read-only scope.
+    Uses Application Default Credentials with read-only scope. The underlying
+    gRPC channel requests gzip compression so the server compresses large
+    report responses, cutting bytes on the wire for row-heavy reports, and
+    uses keepalives so the shared connection stays warm between calls.
     """
+    credentials = _create_credentials()
+    channel = BetaAnalyticsDataGrpcAsyncIOTransport.create_channel(
+        credentials=credentials,
+        compression=grpc.Compression.Gzip,
+        options=_DATA_CHANNEL_OPTIONS,
+    )
+    transport = BetaAnalyticsDataGrpcAsyncIOTransport(channel=channel)
     return data_v1beta.BetaAnalyticsDataAsyncClient(
-        client_info=_CLIENT_INFO, credentials=_create_credentials()
+        client_info=_CLIENT_INFO, transport=transport
     )
 
 
+# Cache of Data API clients, keyed by event loop. Uses weak references so a
+# cached client doesn't outlive the loop that created it.
+_data_api_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, data_v1beta.BetaAnalyticsDataAsyncClient]" = (weakref.WeakKeyDictionary())
+
+
+def get_data_api_client() -> data_v1beta.BetaAnalyticsDataAsyncClient:
+    """Returns a shared Google Analytics Data API async client.
+
+    Creating a client loads credentials and establishes a gRPC channel, which
+    is expensive relative to a single report request. Reuses one client per
+    event loop so that setup cost is paid once and subsequent calls share the
+    warm channel. Clients are cached per loop because a `grpc.aio` channel is
+    bound to the event loop that created it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _data_api_clients.get(loop)
+    if client is None:
+        client = create_data_api_client()
+        _data_api_clients[loop] = client
+    return client
+
+
+# Matches a property ID with optional whitespace and 'properties/' prefix,
+# capturing the numeric ID. Compiled once so construct_property_rn is a
+# single scan instead of separate strip/startswith/split passes.
+_PROPERTY_ID_RE = re.compile(r"\s*(?:properties/)?(\d+)\s*")
+
+
 def construct_property_rn(property_value: int | str) -> str:
     """Returns a property resource name in the format required by APIs."""
-    property_num = None
-    if isinstance(property_value, int):
-        property_num = property_value
-    elif isinstance(property_value, str):
-        property_value = property_value.strip()
-        if property_value.isdigit():
-            property_num = int(property_value)
-        elif property_value.startswith("properties/"):
-            numeric_part = property_value.split("/")[-1]
-            if numeric_part.isdigit():
-                property_num = int(numeric_part)
-    if property_num is None:
+    match = None
+    if isinstance(property_value, (int, str)):
+        match = _PROPERTY_ID_RE.fullmatch(str(property_value))
+    if match is None:
         raise ValueError(
             (
                 f"Invalid property ID: {property_value}. "
@@ -93,7 +145,8 @@ def construct_property_rn(property_value: int | str) -> str:
             )
         )
 
-    return f"properties/{property_num}"
+    # int() normalizes away any leading zeros in the captured ID.
+    return f"properties/{int(match.group(1))}"
 
 
 def proto_to_dict(obj: proto.Message) -> Dict[str, Any]:
@@ -103,6 +156,42 @@ def proto_to_dict(obj: proto.Message) -> Dict[str, Any]:
     )
 
 
+def proto_to_columnar(
+    response: data_v1beta.RunReportResponse,
+) -> Dict[str, Any]:
+    """Converts a report response to a column-oriented dictionary.
+
+    Returns one list per dimension and metric column instead of one dict per
+    row. For large responses the row-oriented form is dominated by per-row
+    dict overhead, while column lists hold a single Python object per value
+    and aggregate directly. Metric values are parsed to floats; missing
+    values become None. Columns are kept as plain lists so the result stays
+    JSON-serializable for tool output.
+    """
+    dimension_names = [header.name for header in response.dimension_headers]
+    metric_names = [header.name for header in response.metric_headers]
+    dimension_columns = {name: [] for name in dimension_names}
+    metric_columns = {name: [] for name in metric_names}
+
+    for row in response.rows:
+        for name, value in zip(dimension_names, row.dimension_values):
+            dimension_columns[name].append(value.value)
+        for name, value in zip(metric_names, row.metric_values):
+            metric_columns[name].append(
+                float(value.value) if value.value else None
+            )
+
+    return {
+        "row_count": response.row_count,
+        "dimensions": dimension_columns,
+        "metrics": metric_columns,
+    }
+
+
 def proto_to_json(obj: proto.Message) -> str:
-    """Converts a proto message to a JSON string."""
-    return type(obj).to_json(obj, indent=None, preserving_proto_field_name=True)
+    """Converts a proto message to a JSON string.
+
+    Serializes with orjson, which is considerably faster than the pure-Python
+    serializer in `google.protobuf.json_format` for large report responses.
+    """
+    return orjson.dumps(proto_to_dict(obj)).decode()
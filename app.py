@@ -1,30 +1,41 @@
 import os
+
 if "GA_KEY_JSON" in os.environ:
     with open("/app/credentials.json", "w") as f:
         f.write(os.environ["GA_KEY_JSON"])
 
-from flask import Flask, request, jsonify
-import subprocess
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+from analytics_mcp.tools.reporting.core import run_report_json
 
-app = Flask(__name__)
+# ASGI app served by uvicorn (see Procfile). Running under uvicorn with
+# uvloop instead of Flask's single-threaded dev server lets concurrent
+# requests overlap on the event loop, each awaiting its own report RPC
+# against the shared gRPC client.
+app = FastAPI()
 
-# Ensure analytics-mcp is installed once on startup
-os.system('pipx install analytics-mcp || true')
 
-@app.route("/run_report", methods=["POST"])
-def run_report():
-    payload = request.json or {}
-    property_id = payload.get("property_id", "")
+@app.post("/run_report")
+async def run_report(request: Request):
+    try:
+        payload = await request.json()
+    except Exception:
+        payload = {}
+    try:
+        # run_report_json serializes the report to bytes exactly once;
+        # the bytes pass straight through as the response body.
+        return Response(
+            await run_report_json(**payload), media_type="application/json"
+        )
+    except TypeError as e:
+        # Raised when the payload doesn't match run_report's signature.
+        return JSONResponse({"error": str(e)}, status_code=400)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
 
-    # Compose and run the analytics-mcp command directly
-    cmd = ["analytics-mcp", "run_report", property_id]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return jsonify({
-        "command": cmd,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
-        "returncode": result.returncode
-    })
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=5000)
@@ -17,6 +17,7 @@
 import unittest
 
 from analytics_mcp.tools import utils
+from google.analytics import data_v1beta
 
 
 class TestUtils(unittest.TestCase):
@@ -68,3 +69,29 @@ class TestUtils(unittest.TestCase):
             msg="Resource name with more than 2 components should fail",
         ):
             utils.construct_property_rn("properties/123/abc")
+
+    def test_proto_to_columnar(self):
+        """Tests that proto_to_columnar transposes rows into columns."""
+        response = data_v1beta.RunReportResponse(
+            dimension_headers=[{"name": "eventName"}],
+            metric_headers=[{"name": "eventCount", "type_": "TYPE_INTEGER"}],
+            rows=[
+                {
+                    "dimension_values": [{"value": "page_view"}],
+                    "metric_values": [{"value": "100"}],
+                },
+                {
+                    "dimension_values": [{"value": "purchase"}],
+                    "metric_values": [{"value": ""}],
+                },
+            ],
+            row_count=2,
+        )
+        self.assertEqual(
+            utils.proto_to_columnar(response),
+            {
+                "row_count": 2,
+                "dimensions": {"eventName": ["page_view", "purchase"]},
+                "metrics": {"eventCount": [100.0, None]},
+            },
+        )